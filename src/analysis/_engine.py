@@ -0,0 +1,181 @@
+"""Optional Polars backend for the analysis scripts.
+
+The pandas implementations in the sibling modules remain the default. When
+``polars`` is installed, the scripts accept ``--engine polars`` and delegate to
+the lazy group-by plans defined here, which produce the same metric layout.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from utils.io import load_dataframe
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - optional dependency
+    pl = None  # type: ignore[assignment, unused-ignore]
+
+if TYPE_CHECKING:
+    from polars.lazyframe.group_by import LazyGroupBy
+
+
+def _require_polars() -> None:
+    if pl is None:
+        raise RuntimeError("The polars engine requires the 'polars' package")
+
+
+def _require_columns(dataset: pl.DataFrame, *columns: str) -> None:
+    for column in columns:
+        if column not in dataset.columns:
+            raise ValueError(f"Canonical dataset must include a '{column}' column")
+
+
+def _numeric(column: str) -> pl.Expr:
+    return pl.col(column).cast(pl.Float64, strict=False).fill_nan(None)
+
+
+def load_polars(path: str | Path) -> pl.DataFrame:
+    """Load the canonical dataset as a :class:`polars.DataFrame`."""
+    _require_polars()
+    file_path = Path(path)
+    if file_path.suffix.lower() == ".csv" and file_path.exists():
+        return pl.read_csv(file_path, infer_schema_length=None)
+    frame = load_dataframe(file_path)
+    # Go through Python lists so that extension dtypes (e.g. pandas' string
+    # dtype) do not require pyarrow for the conversion.
+    return pl.DataFrame(
+        {
+            str(column): frame[column]
+            .astype(object)
+            .where(frame[column].notna(), None)
+            .tolist()
+            for column in frame.columns
+        },
+        strict=False,
+    )
+
+
+def _grouped(dataset: pl.DataFrame) -> LazyGroupBy:
+    return (
+        dataset.lazy()
+        .filter(pl.col("index").is_not_null())
+        .group_by("index", maintain_order=True)
+    )
+
+
+def compute_pbr_stats_polars(dataset: pl.DataFrame) -> dict[str, Any]:
+    _require_polars()
+    _require_columns(dataset, "index", "pbr")
+    pbr = _numeric("pbr")
+    summary = (
+        _grouped(dataset)
+        .agg(
+            pbr.lt(1.0).sum().alias("lt1"),
+            pbr.mean().alias("mean"),
+            pbr.median().alias("median"),
+            pbr.count().alias("count"),
+        )
+        .with_columns(
+            pl.when(pl.col("count") > 0)
+            .then(pl.col("lt1") / pl.col("count"))
+            .otherwise(None)
+            .alias("lt1")
+        )
+        .collect()
+    )
+
+    metrics: dict[str, dict[str, Any]] = {
+        "lt1": {},
+        "mean": {},
+        "median": {},
+        "count": {},
+    }
+    for row in summary.iter_rows(named=True):
+        for key in metrics:
+            metrics[key][row["index"]] = row[key]
+    return metrics
+
+
+def compute_roe_stats_polars(
+    dataset: pl.DataFrame, quantiles: tuple[float, ...]
+) -> dict[str, Any]:
+    _require_polars()
+    _require_columns(dataset, "index", "roe")
+    roe = _numeric("roe")
+    labels = [str(int(q * 100)) for q in quantiles]
+    summary = (
+        _grouped(dataset)
+        .agg(
+            roe.count().alias("count"),
+            *(
+                roe.quantile(q, interpolation="linear").alias(label)
+                for q, label in zip(quantiles, labels, strict=True)
+            ),
+        )
+        .collect()
+    )
+
+    metrics: dict[str, Any] = {
+        "median": {},
+        "quantiles": {label: {} for label in labels},
+        "count": {},
+    }
+    for row in summary.iter_rows(named=True):
+        index_name = row["index"]
+        metrics["count"][index_name] = row["count"]
+        for label in labels:
+            metrics["quantiles"][label][index_name] = row[label]
+        metrics["median"][index_name] = metrics["quantiles"]["50"][index_name]
+    return metrics
+
+
+def compute_concentration_metrics_polars(
+    dataset: pl.DataFrame, top_n: int
+) -> dict[str, Any]:
+    _require_polars()
+    _require_columns(dataset, "index", "sector")
+    weight = (
+        _numeric("weight").fill_null(0.0)
+        if "weight" in dataset.columns
+        else pl.lit(0.0, dtype=pl.Float64)
+    )
+    total = weight.sum().over("index")
+    normalized = (
+        dataset.lazy()
+        .filter(pl.col("index").is_not_null())
+        .select(
+            pl.col("index"),
+            pl.col("sector").fill_null("Unknown"),
+            pl.when(total > 0)
+            .then(weight / total)
+            .otherwise(1.0 / pl.len().over("index"))
+            .alias("w"),
+        )
+    )
+    hhi = (
+        normalized.group_by(["index", "sector"])
+        .agg(pl.col("w").sum())
+        .group_by("index")
+        .agg(pl.col("w").pow(2).sum().alias("hhi"))
+    )
+    summary = (
+        normalized.group_by("index", maintain_order=True)
+        .agg(
+            pl.col("w").top_k(top_n).sum().alias("top10_weight"),
+            pl.len().alias("constituents"),
+        )
+        .join(hhi, on="index", how="left")
+        .collect()
+    )
+
+    metrics: dict[str, Any] = {
+        "hhi": {},
+        "top10_weight": {},
+        "constituents": {},
+    }
+    for row in summary.iter_rows(named=True):
+        for key in metrics:
+            metrics[key][row["index"]] = row[key]
+    return metrics
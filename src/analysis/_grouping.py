@@ -0,0 +1,112 @@
+"""Sort-and-slice helpers shared by the per-index statistics.
+
+The canonical dataset only has a handful of distinct indices, so rather than
+going through pandas' group-by machinery the values are sorted by
+``(index, value)`` once and every group becomes a contiguous ascending slice
+delimited by ``offsets[g]:offsets[g + 1]``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Below this many values the pure-Python loop is faster than importing Numba
+# and loading (or compiling) the cached kernel.
+NUMBA_MIN_VALUES = 10_000
+
+
+def sorted_groups(
+    keys: pd.Series, values: pd.Series
+) -> tuple[pd.Index, np.ndarray, np.ndarray]:
+    """Group numeric *values* by *keys* into sorted contiguous slices.
+
+    Values are coerced with :func:`pandas.to_numeric`; rows with a missing key
+    or a non-numeric value are dropped. Returns the group names (in order of
+    first appearance), the sorted values and the ``len(names) + 1`` offsets.
+    """
+    codes, names = pd.factorize(keys)
+    numbers = pd.to_numeric(values, errors="coerce").to_numpy(
+        dtype=float, na_value=np.nan
+    )
+    valid = (codes >= 0) & ~np.isnan(numbers)
+    valid_codes = codes[valid]
+    numbers = numbers[valid]
+
+    order = np.lexsort((numbers, valid_codes))
+    offsets = np.searchsorted(valid_codes[order], np.arange(len(names) + 1))
+    return names, numbers[order], offsets
+
+
+def group_quantiles(
+    values: np.ndarray, offsets: np.ndarray, quantiles: np.ndarray
+) -> np.ndarray:
+    """Linearly interpolated quantiles for each sorted, contiguous group.
+
+    Returns an array of shape ``(n_groups, len(quantiles))``; empty groups
+    yield NaN. Large inputs run through a Numba kernel when it is installed.
+    """
+    if len(values) >= NUMBA_MIN_VALUES:
+        kernel = _compiled_group_quantiles()
+        if kernel is not None:
+            return kernel(values, offsets, quantiles)
+    return _group_quantiles(values, offsets, quantiles)
+
+
+def _group_quantiles(
+    values: np.ndarray, offsets: np.ndarray, quantiles: np.ndarray
+) -> np.ndarray:
+    n_groups = len(offsets) - 1
+    result = np.full((n_groups, len(quantiles)), np.nan)
+    for group in range(n_groups):
+        start = offsets[group]
+        size = offsets[group + 1] - start
+        if size == 0:
+            continue
+        for column in range(len(quantiles)):
+            position = quantiles[column] * (size - 1)
+            lower = int(np.floor(position))
+            upper = min(lower + 1, size - 1)
+            low_value = values[start + lower]
+            high_value = values[start + upper]
+            result[group, column] = low_value + (high_value - low_value) * (
+                position - lower
+            )
+    return result
+
+
+@lru_cache(maxsize=1)
+def _compiled_group_quantiles() -> Callable[..., np.ndarray] | None:
+    """Import Numba on first use and JIT the quantile kernel, if available."""
+    try:
+        from numba import njit
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return njit(cache=True, nogil=True)(_group_quantiles)
+
+
+def group_sums(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Sum each contiguous group; empty groups sum to zero."""
+    return np.array(
+        [
+            values[start:end].sum()
+            for start, end in zip(offsets[:-1], offsets[1:], strict=True)
+        ],
+        dtype=float,
+    )
+
+
+def group_counts_below(
+    values: np.ndarray, offsets: np.ndarray, threshold: float
+) -> np.ndarray:
+    """Count the values strictly below *threshold* in each sorted group."""
+    return np.array(
+        [
+            np.searchsorted(values[start:end], threshold, side="left")
+            for start, end in zip(offsets[:-1], offsets[1:], strict=True)
+        ],
+        dtype=np.int64,
+    )
@@ -13,7 +13,14 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import numpy as np  # noqa: E402
 import pandas as pd  # noqa: E402
+from analysis._grouping import (  # noqa: E402
+    group_counts_below,
+    group_quantiles,
+    group_sums,
+    sorted_groups,
+)
 from utils.io import dump_json, load_dataframe  # noqa: E402
 
 LOGGER = logging.getLogger(__name__)
@@ -27,31 +34,31 @@ def compute_pbr_stats(dataset: pd.DataFrame) -> dict[str, Any]:
     if "pbr" not in dataset.columns:
         raise ValueError("Canonical dataset must include a 'pbr' column")
 
-    dataset = dataset.copy()
-    dataset["pbr"] = pd.to_numeric(dataset["pbr"], errors="coerce")
+    index_names, values, offsets = sorted_groups(dataset["index"], dataset["pbr"])
+    counts = np.diff(offsets)
+    sums = group_sums(values, offsets)
+    below_one = group_counts_below(values, offsets, 1.0)
+    medians = group_quantiles(values, offsets, np.array([0.5]))[:, 0]
+
+    # Indices without any PBR values yield 0 / 0 = NaN, reported as ``None``.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        columns = {
+            "lt1": below_one / counts,
+            "mean": sums / counts,
+            "median": medians,
+        }
 
     metrics: dict[str, dict[str, Any]] = {
-        "lt1": {},
-        "mean": {},
-        "median": {},
-        "count": {},
+        name: {
+            index_name: None if np.isnan(value) else float(value)
+            for index_name, value in zip(index_names, column, strict=True)
+        }
+        for name, column in columns.items()
+    }
+    metrics["count"] = {
+        index_name: int(count)
+        for index_name, count in zip(index_names, counts, strict=True)
     }
-
-    for index_name, subset in dataset.groupby("index"):
-        series = subset["pbr"].dropna()
-        count = int(series.count())
-        metrics["count"][index_name] = count
-        if count == 0:
-            metrics["lt1"][index_name] = None
-            metrics["mean"][index_name] = None
-            metrics["median"][index_name] = None
-            continue
-
-        lt1_ratio = float((series < 1.0).sum() / count)
-        metrics["lt1"][index_name] = lt1_ratio
-        metrics["mean"][index_name] = float(series.mean())
-        metrics["median"][index_name] = float(series.median())
-
     return metrics
 
 
@@ -59,6 +66,7 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--in", dest="input_path", type=Path, required=True)
     parser.add_argument("--out", dest="output_path", type=Path, required=True)
+    parser.add_argument("--engine", choices=("pandas", "polars"), default="pandas")
     return parser.parse_args()
 
 
@@ -66,8 +74,13 @@ def main() -> None:
     logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     args = parse_args()
     LOGGER.info("Loading canonical dataset from %s", args.input_path)
-    dataset = load_dataframe(args.input_path)
-    metrics = compute_pbr_stats(dataset)
+    if args.engine == "polars":
+        # Imported lazily so that default pandas runs never load polars.
+        from analysis._engine import compute_pbr_stats_polars, load_polars
+
+        metrics = compute_pbr_stats_polars(load_polars(args.input_path))
+    else:
+        metrics = compute_pbr_stats(load_dataframe(args.input_path))
     LOGGER.info("Writing PBR metrics to %s", args.output_path)
     dump_json(metrics, args.output_path)
 
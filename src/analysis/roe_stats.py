@@ -13,7 +13,9 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import numpy as np  # noqa: E402
 import pandas as pd  # noqa: E402
+from analysis._grouping import group_quantiles, sorted_groups  # noqa: E402
 from utils.io import dump_json, load_dataframe  # noqa: E402
 
 LOGGER = logging.getLogger(__name__)
@@ -26,8 +28,8 @@ def compute_roe_stats(dataset: pd.DataFrame) -> dict[str, Any]:
     if "roe" not in dataset.columns:
         raise ValueError("Canonical dataset must include a 'roe' column")
 
-    dataset = dataset.copy()
-    dataset["roe"] = pd.to_numeric(dataset["roe"], errors="coerce")
+    index_names, values, offsets = sorted_groups(dataset["index"], dataset["roe"])
+    quantiles = group_quantiles(values, offsets, np.asarray(QUANTILES, dtype=float))
 
     metrics: dict[str, Any] = {
         "median": {},
@@ -35,21 +37,14 @@ def compute_roe_stats(dataset: pd.DataFrame) -> dict[str, Any]:
         "count": {},
     }
 
-    for index_name, subset in dataset.groupby("index"):
-        series = subset["roe"].dropna()
-        count = int(series.count())
-        metrics["count"][index_name] = count
-        if count == 0:
-            metrics["median"][index_name] = None
-            for q in QUANTILES:
-                metrics["quantiles"][str(int(q * 100))][index_name] = None
-            continue
-
-        metrics["median"][index_name] = float(series.median())
-        for q in QUANTILES:
-            metrics["quantiles"][str(int(q * 100))][index_name] = float(
-                series.quantile(q)
+    for position, index_name in enumerate(index_names):
+        metrics["count"][index_name] = int(offsets[position + 1] - offsets[position])
+        for column, q in enumerate(QUANTILES):
+            value = quantiles[position, column]
+            metrics["quantiles"][str(int(q * 100))][index_name] = (
+                None if np.isnan(value) else float(value)
             )
+        metrics["median"][index_name] = metrics["quantiles"]["50"][index_name]
 
     return metrics
 
@@ -58,14 +53,20 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--in", dest="input_path", type=Path, required=True)
     parser.add_argument("--out", dest="output_path", type=Path, required=True)
+    parser.add_argument("--engine", choices=("pandas", "polars"), default="pandas")
     return parser.parse_args()
 
 
 def main() -> None:
     logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     args = parse_args()
-    dataset = load_dataframe(args.input_path)
-    metrics = compute_roe_stats(dataset)
+    if args.engine == "polars":
+        # Imported lazily so that default pandas runs never load polars.
+        from analysis._engine import compute_roe_stats_polars, load_polars
+
+        metrics = compute_roe_stats_polars(load_polars(args.input_path), QUANTILES)
+    else:
+        metrics = compute_roe_stats(load_dataframe(args.input_path))
     dump_json(metrics, args.output_path)
 
 
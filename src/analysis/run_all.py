@@ -0,0 +1,84 @@
+"""Compute every metric file from a single load of the canonical dataset."""
+
+# ruff: noqa: I001
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pandas as pd  # noqa: E402
+from analysis.pbr_stats import compute_pbr_stats  # noqa: E402
+from analysis.roe_stats import compute_roe_stats  # noqa: E402
+from analysis.sector_hhi import compute_concentration_metrics  # noqa: E402
+from analysis.yield_stats import compute_yield_stats  # noqa: E402
+from utils.io import dump_json, load_dataframe  # noqa: E402
+
+LOGGER = logging.getLogger(__name__)
+
+CALCULATORS: dict[str, Callable[[pd.DataFrame], dict[str, Any]]] = {
+    "pbr": compute_pbr_stats,
+    "roe": compute_roe_stats,
+    "hhi": compute_concentration_metrics,
+    "yield_file": compute_yield_stats,
+}
+
+
+def compute_all(
+    dataset: pd.DataFrame, names: list[str] | None = None
+) -> dict[str, dict[str, Any]]:
+    """Run the selected calculators (all by default) against *dataset*.
+
+    The calculators only read *dataset* and spend most of their time in
+    NumPy/pandas kernels that release the GIL, so they run on a thread pool.
+    """
+    selected = list(CALCULATORS) if names is None else names
+    if not selected:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(selected)) as executor:
+        futures = {
+            name: executor.submit(CALCULATORS[name], dataset) for name in selected
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--in", dest="input_path", type=Path, required=True)
+    parser.add_argument("--pbr", dest="pbr", type=Path)
+    parser.add_argument("--roe", dest="roe", type=Path)
+    parser.add_argument("--hhi", dest="hhi", type=Path)
+    parser.add_argument("--yield", dest="yield_file", type=Path)
+    return parser.parse_args()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    args = parse_args()
+    outputs: dict[str, Path] = {
+        name: getattr(args, name)
+        for name in CALCULATORS
+        if getattr(args, name) is not None
+    }
+    if not outputs:
+        raise SystemExit("No output paths given; pass --pbr/--roe/--hhi/--yield")
+
+    LOGGER.info("Loading canonical dataset from %s", args.input_path)
+    dataset = load_dataframe(args.input_path)
+    results = compute_all(dataset, list(outputs))
+    for name, output_path in outputs.items():
+        LOGGER.info("Writing %s metrics to %s", name, output_path)
+        dump_json(results[name], output_path)
+
+
+if __name__ == "__main__":
+    main()
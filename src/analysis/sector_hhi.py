@@ -13,25 +13,67 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import numpy as np  # noqa: E402
 import pandas as pd  # noqa: E402
 from utils.io import dump_json, load_dataframe  # noqa: E402
 
 LOGGER = logging.getLogger(__name__)
+TOP_N = 10
 
 
-def _resolve_weights(subset: pd.DataFrame) -> pd.Series:
-    weights = pd.to_numeric(subset.get("weight"), errors="coerce")
-    if weights.notna().any():
-        weights = weights.fillna(0.0)
+def _resolve_weights(dataset: pd.DataFrame, index: pd.Series) -> pd.Series:
+    """Normalize constituent weights so that they sum to one within each index.
+
+    Indices without any usable (positive) weights fall back to equal weighting.
+    """
+    if "weight" in dataset.columns:
+        weights = pd.to_numeric(dataset["weight"], errors="coerce").fillna(0.0)
     else:
-        weights = pd.Series(1.0, index=subset.index)
+        weights = pd.Series(0.0, index=dataset.index)
+
+    grouped = weights.groupby(index, observed=True, sort=False)
+    totals = grouped.transform("sum")
+    sizes = grouped.transform("size")
+    return (weights / totals).where(totals > 0, 1.0 / sizes)
+
+
+def _top_n_sum(weights: pd.Series, n: int = TOP_N) -> float:
+    """Sum the *n* largest weights using an O(n) partial partition."""
+    values = weights.to_numpy(dtype=float)
+    if len(values) <= n:
+        return float(values.sum())
+    return float(np.partition(values, -n)[-n:].sum())
+
+
+def _sector_hhi(
+    index_codes: np.ndarray, sector: pd.Series, weights: np.ndarray, n_indices: int
+) -> np.ndarray:
+    """Return the sector HHI for each factorized index code.
 
-    total = float(weights.sum())
-    if total <= 0:
-        weights = pd.Series(1.0, index=subset.index)
-        total = float(weights.sum())
+    Each (index, sector) pair is mapped to a single integer key so that all
+    sector weight sums are produced by one ``np.bincount`` pass.
+    """
+    sector_codes, sector_names = pd.factorize(sector)
+    n_sectors = len(sector_names)
+    valid = index_codes >= 0
+    pair_codes = index_codes[valid] * n_sectors + sector_codes[valid]
+    sector_weights = np.bincount(
+        pair_codes, weights=weights[valid], minlength=n_indices * n_sectors
+    )
+    return np.square(sector_weights.reshape(n_indices, n_sectors)).sum(axis=1)
 
-    return weights / total
+
+def _sector_labels(sector: pd.Series) -> pd.Series:
+    """Return the sector column with missing labels replaced by ``Unknown``.
+
+    Categorical columns are trimmed to the categories actually present so that
+    unused categories never reach the aggregation.
+    """
+    if isinstance(sector.dtype, pd.CategoricalDtype):
+        sector = sector.cat.remove_unused_categories()
+        if "Unknown" not in sector.cat.categories:
+            sector = sector.cat.add_categories("Unknown")
+    return sector.fillna("Unknown")
 
 
 def compute_concentration_metrics(dataset: pd.DataFrame) -> dict[str, Any]:
@@ -40,21 +82,29 @@ def compute_concentration_metrics(dataset: pd.DataFrame) -> dict[str, Any]:
     if "sector" not in dataset.columns:
         raise ValueError("Canonical dataset must include a 'sector' column")
 
+    index = dataset["index"]
+    sector = _sector_labels(dataset["sector"])
+    weights = _resolve_weights(dataset, index)
+    by_index = weights.groupby(index, observed=True, sort=False)
+
+    index_codes, index_names = pd.factorize(index)
+    hhi = _sector_hhi(
+        index_codes, sector, weights.to_numpy(dtype=float), len(index_names)
+    )
+    top10 = by_index.agg(_top_n_sum)
+    constituents = by_index.size()
+
     metrics: dict[str, Any] = {
         "hhi": {},
         "top10_weight": {},
         "constituents": {},
     }
 
-    for index_name, subset in dataset.groupby("index"):
-        weights = _resolve_weights(subset)
-        sector_series = subset["sector"].fillna("Unknown")
-        sector_weights = weights.groupby(sector_series).sum()
-        hhi_value = float((sector_weights**2).sum())
-        top10_value = float(weights.sort_values(ascending=False).head(10).sum())
-        metrics["hhi"][index_name] = hhi_value
-        metrics["top10_weight"][index_name] = top10_value
-        metrics["constituents"][index_name] = int(len(subset))
+    for index_name, value in zip(index_names, hhi, strict=True):
+        metrics["hhi"][index_name] = float(value)
+    for index_name, count in constituents.items():
+        metrics["top10_weight"][index_name] = float(top10[index_name])
+        metrics["constituents"][index_name] = int(count)
 
     return metrics
 
@@ -63,14 +113,22 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--in", dest="input_path", type=Path, required=True)
     parser.add_argument("--out", dest="output_path", type=Path, required=True)
+    parser.add_argument("--engine", choices=("pandas", "polars"), default="pandas")
     return parser.parse_args()
 
 
 def main() -> None:
     logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     args = parse_args()
-    dataset = load_dataframe(args.input_path)
-    metrics = compute_concentration_metrics(dataset)
+    if args.engine == "polars":
+        # Imported lazily so that default pandas runs never load polars.
+        from analysis._engine import compute_concentration_metrics_polars, load_polars
+
+        metrics = compute_concentration_metrics_polars(
+            load_polars(args.input_path), TOP_N
+        )
+    else:
+        metrics = compute_concentration_metrics(load_dataframe(args.input_path))
     dump_json(metrics, args.output_path)
 
 
@@ -13,7 +13,13 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import numpy as np  # noqa: E402
 import pandas as pd  # noqa: E402
+from analysis._grouping import (  # noqa: E402
+    group_quantiles,
+    group_sums,
+    sorted_groups,
+)
 from utils.io import dump_json, load_dataframe  # noqa: E402
 
 LOGGER = logging.getLogger(__name__)
@@ -25,26 +31,25 @@ def compute_yield_stats(dataset: pd.DataFrame) -> dict[str, Any]:
     if "dy" not in dataset.columns:
         raise ValueError("Canonical dataset must include a 'dy' column")
 
-    dataset = dataset.copy()
-    dataset["dy"] = pd.to_numeric(dataset["dy"], errors="coerce")
+    index_names, values, offsets = sorted_groups(dataset["index"], dataset["dy"])
+    counts = np.diff(offsets)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        columns = {
+            "mean": group_sums(values, offsets) / counts,
+            "median": group_quantiles(values, offsets, np.array([0.5]))[:, 0],
+        }
 
     metrics: dict[str, dict[str, Any]] = {
-        "mean": {},
-        "median": {},
-        "count": {},
+        name: {
+            index_name: None if np.isnan(value) else float(value)
+            for index_name, value in zip(index_names, column, strict=True)
+        }
+        for name, column in columns.items()
+    }
+    metrics["count"] = {
+        index_name: int(count)
+        for index_name, count in zip(index_names, counts, strict=True)
     }
-
-    for index_name, subset in dataset.groupby("index"):
-        series = subset["dy"].dropna()
-        count = int(series.count())
-        metrics["count"][index_name] = count
-        if count == 0:
-            metrics["mean"][index_name] = None
-            metrics["median"][index_name] = None
-            continue
-        metrics["mean"][index_name] = float(series.mean())
-        metrics["median"][index_name] = float(series.median())
-
     return metrics
 
 
@@ -7,6 +7,7 @@ from __future__ import annotations
 import argparse
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -41,41 +42,55 @@ def load_prompt(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
-def _call_openai(prompt: str, model: str, temperature: float) -> str | None:
+@lru_cache(maxsize=1)
+def _get_client() -> Any:
+    from openai import OpenAI
+
+    return OpenAI()
+
+
+def _stream_openai(prompt: str, model: str, temperature: float, output: Path) -> bool:
+    """Stream the model response into *output*; return whether text was written.
+
+    Deltas are written to a ``.part`` sibling as they arrive and moved into
+    place once the stream completes, so a failed call never leaves a
+    truncated notes file behind.
+    """
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         LOGGER.warning("OPENAI_API_KEY is not configured; skipping Codex refresh.")
-        return None
+        return False
 
     try:
-        from openai import OpenAI
+        client = _get_client()
     except ImportError:
         LOGGER.warning("openai package is not installed; skipping Codex refresh.")
-        return None
+        return False
 
-    client = OpenAI()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    partial = output.with_name(output.name + ".part")
+    wrote_text = False
     try:
-        response = client.responses.create(
-            model=model, input=prompt, temperature=temperature
-        )
+        with (
+            client.responses.stream(
+                model=model, input=prompt, temperature=temperature
+            ) as stream,
+            partial.open("w", encoding="utf-8") as handle,
+        ):
+            for event in stream:
+                if event.type == "response.output_text.delta" and event.delta:
+                    handle.write(event.delta)
+                    wrote_text = True
     except Exception as exc:  # noqa: BLE001
         LOGGER.error("OpenAI API call failed: %s", exc)
-        return None
-
-    if hasattr(response, "output_text"):
-        return str(response.output_text)
-
-    choices: Any = getattr(response, "choices", None)
-    if isinstance(choices, list):
-        texts: list[str] = []
-        for choice in choices:
-            message = getattr(choice, "message", None)
-            if message and getattr(message, "content", None):
-                texts.append(str(message.content))
-        if texts:
-            return "\n".join(texts)
+        partial.unlink(missing_ok=True)
+        return False
 
-    return str(response)
+    if not wrote_text:
+        partial.unlink(missing_ok=True)
+        return False
+    partial.replace(output)
+    return True
 
 
 def main() -> None:
@@ -83,13 +98,11 @@ def main() -> None:
     args = parse_args()
     prompt_text = load_prompt(args.prompt)
     LOGGER.info("Submitting prompt to OpenAI model %s", args.model)
-    output = _call_openai(prompt_text, args.model, args.temperature)
 
-    args.output.parent.mkdir(parents=True, exist_ok=True)
-    if output:
-        args.output.write_text(output, encoding="utf-8")
+    if _stream_openai(prompt_text, args.model, args.temperature, args.output):
         LOGGER.info("Codex notes updated at %s", args.output)
     else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
         placeholder = (
             "## Codex refresh unavailable\n\n"
             "自動生成コメントは現在利用できません。OPENAI_API_KEYの設定やネットワーク状態を確認してください。\n"
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import logging
 from collections.abc import Iterable
 from datetime import UTC, datetime
@@ -17,14 +18,23 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import numpy as np  # noqa: E402
 import pandas as pd  # noqa: E402
-import yaml  # type: ignore[import-untyped]  # noqa: E402
 
-from utils.io import dump_yaml  # noqa: E402
+from utils.io import (  # noqa: E402
+    dump_parquet_cache,
+    dump_yaml_records,
+    load_yaml,
+)
 
 LOGGER = logging.getLogger(__name__)
 
 
+# Arrow-backed strings make the code merge key compact and cheap to hash.
+CODE_DTYPE = (
+    "string[pyarrow]" if importlib.util.find_spec("pyarrow") is not None else None
+)
+
 NUMERIC_COLUMNS = [
     "pbr",
     "roe",
@@ -37,11 +47,15 @@ NUMERIC_COLUMNS = [
 def _load_yaml(path: Path) -> Any:
     if not path.exists():
         raise FileNotFoundError(f"Input file not found: {path}")
-    return yaml.safe_load(path.read_text(encoding="utf-8"))
+    return load_yaml(path)
 
 
 def _normalize_constituents(raw_data: Any) -> pd.DataFrame:
-    rows: list[dict[str, Any]] = []
+    indices: list[Any] = []
+    codes: list[str] = []
+    names: list[Any] = []
+    sectors: list[Any] = []
+    weights: list[Any] = []
     pairs: Iterable[tuple[str | None, Any]]
     if isinstance(raw_data, dict):
         pairs = raw_data.items()
@@ -62,19 +76,24 @@ def _normalize_constituents(raw_data: Any) -> pd.DataFrame:
         for entry in candidate_entries:
             if not isinstance(entry, dict):
                 continue
-            record = {
-                "index": entry.get("index") or index_name or "yomiuri333",
-                "code": str(entry.get("code", "")).strip(),
-                "name": entry.get("name", ""),
-                "sector": entry.get("sector", "Unknown"),
-                "weight": entry.get("weight"),
-            }
-            rows.append(record)
-
-    if not rows:
+            indices.append(entry.get("index") or index_name or "yomiuri333")
+            codes.append(sys.intern(str(entry.get("code", "")).strip()))
+            names.append(entry.get("name", ""))
+            sectors.append(entry.get("sector", "Unknown"))
+            weights.append(entry.get("weight"))
+
+    if not codes:
         raise ValueError("No constituent records found")
 
-    frame = pd.DataFrame(rows)
+    frame = pd.DataFrame(
+        {
+            "index": indices,
+            "code": codes,
+            "name": names,
+            "sector": sectors,
+            "weight": weights,
+        }
+    )
     frame["index"] = frame["index"].fillna("yomiuri333")
     return frame
 
@@ -83,46 +102,57 @@ def _normalize_financials(raw_data: Any) -> pd.DataFrame:
     if raw_data is None:
         return pd.DataFrame()
 
+    groups: list[tuple[Any, Any]]
     if isinstance(raw_data, dict) and "records" in raw_data:
-        entries = raw_data["records"]
+        groups = [("yomiuri333", raw_data["records"])]
     elif isinstance(raw_data, dict):
-        entries = []
-        for index_name, index_records in raw_data.items():
-            if isinstance(index_records, list):
-                for item in index_records:
-                    if isinstance(item, dict):
-                        normalized_entry = {**item}
-                        normalized_entry.setdefault("index", index_name)
-                        entries.append(normalized_entry)
+        groups = [
+            (index_name, index_records)
+            for index_name, index_records in raw_data.items()
+            if isinstance(index_records, list)
+        ]
     else:
-        entries = raw_data
-
-    if not isinstance(entries, list):
-        raise ValueError("Financial records must be provided as a list")
-
-    normalized: list[dict[str, Any]] = []
-    for entry in entries:
-        if not isinstance(entry, dict):
-            continue
-        normalized.append(
-            {
-                "index": entry.get("index", "yomiuri333"),
-                "code": str(entry.get("code", "")).strip(),
-                "date": entry.get("date"),
-                "pbr": entry.get("pbr"),
-                "roe": entry.get("roe"),
-                "dy": entry.get("dy"),
-                "market_cap": entry.get("market_cap"),
-                "weight": entry.get("weight"),
-            }
-        )
-
-    if not normalized:
+        groups = [("yomiuri333", raw_data)]
+
+    indices: list[Any] = []
+    codes: list[str] = []
+    dates: list[Any] = []
+    pbrs: list[Any] = []
+    roes: list[Any] = []
+    yields: list[Any] = []
+    market_caps: list[Any] = []
+    weights: list[Any] = []
+    for default_index, entries in groups:
+        if not isinstance(entries, list):
+            raise ValueError("Financial records must be provided as a list")
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            indices.append(entry.get("index", default_index))
+            codes.append(sys.intern(str(entry.get("code", "")).strip()))
+            dates.append(entry.get("date"))
+            pbrs.append(entry.get("pbr"))
+            roes.append(entry.get("roe"))
+            yields.append(entry.get("dy"))
+            market_caps.append(entry.get("market_cap"))
+            weights.append(entry.get("weight"))
+
+    if not codes:
         return pd.DataFrame()
 
-    frame = pd.DataFrame(normalized)
-    if "date" in frame.columns:
-        frame["date"] = pd.to_datetime(frame["date"], errors="coerce")
+    frame = pd.DataFrame(
+        {
+            "index": indices,
+            "code": codes,
+            "date": dates,
+            "pbr": pbrs,
+            "roe": roes,
+            "dy": yields,
+            "market_cap": market_caps,
+            "weight": weights,
+        }
+    )
+    frame["date"] = pd.to_datetime(frame["date"], errors="coerce")
     return frame
 
 
@@ -133,6 +163,10 @@ def build_canonical(constituents_path: Path, financials_path: Path) -> pd.DataFr
 
     constituents_df = _normalize_constituents(constituents_raw)
     financials_df = _normalize_financials(financials_raw)
+    if CODE_DTYPE is not None:
+        constituents_df["code"] = constituents_df["code"].astype(CODE_DTYPE)
+        if "code" in financials_df.columns:
+            financials_df["code"] = financials_df["code"].astype(CODE_DTYPE)
 
     if not financials_df.empty:
         # Deduplicate by selecting the latest available date for each code/index pair.
@@ -159,13 +193,19 @@ def build_canonical(constituents_path: Path, financials_path: Path) -> pd.DataFr
         merged["weight"] = merged["weight"].fillna(merged["weight_fin"])
         merged = merged.drop(columns=["weight_fin"])
 
-    for column in NUMERIC_COLUMNS:
-        if column in merged.columns:
-            merged[column] = pd.to_numeric(merged[column], errors="coerce")
+    present = [column for column in NUMERIC_COLUMNS if column in merged.columns]
+    merged[present] = merged[present].apply(pd.to_numeric, errors="coerce")
 
     if "date" in merged.columns:
-        merged["date"] = merged["date"].astype("datetime64[ns]")
-        merged["date"] = merged["date"].dt.strftime("%Y-%m-%d")
+        dates = merged["date"]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors="coerce")
+        # Truncating to day precision lets NumPy render ISO dates directly,
+        # avoiding strftime's per-element Python formatting.
+        days = dates.to_numpy(dtype="datetime64[D]")
+        merged["date"] = pd.Series(days.astype(str), index=merged.index).where(
+            ~np.isnat(days)
+        )
 
     merged = merged.sort_values(["index", "code"]).reset_index(drop=True)
     return merged
@@ -174,13 +214,16 @@ def build_canonical(constituents_path: Path, financials_path: Path) -> pd.DataFr
 def write_output(dataset: pd.DataFrame, output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     if output_path.suffix.lower() in {".yaml", ".yml"}:
-        payload = {
-            "generated_at": datetime.now(UTC).isoformat(timespec="seconds"),
-            "records": dataset.to_dict(orient="records"),
-        }
-        dump_yaml(payload, output_path)
+        columns = [str(column) for column in dataset.columns]
+        records = (
+            dict(zip(columns, row, strict=True))
+            for row in dataset.itertuples(index=False, name=None)
+        )
+        header = {"generated_at": datetime.now(UTC).isoformat(timespec="seconds")}
+        dump_yaml_records(header, "records", records, output_path)
     else:
         dataset.to_csv(output_path, index=False)
+    dump_parquet_cache(dataset, output_path)
 
 
 def parse_args() -> argparse.Namespace:
@@ -18,7 +18,7 @@ from render.common import (  # noqa: E402
     build_environment,
     current_timestamp,
     derive_logic_summary,
-    load_metrics,
+    load_metric_files,
     safe_get,
     wrap_metrics,
 )
@@ -99,10 +99,9 @@ def main() -> None:
     env = build_environment(args.template, enable_autoescape=True)
     template = env.get_template(args.template.name)
 
-    pbr_metrics = load_metrics(args.pbr)
-    roe_metrics = load_metrics(args.roe)
-    hhi_metrics = load_metrics(args.hhi)
-    dy_metrics = load_metrics(args.yield_file)
+    pbr_metrics, roe_metrics, hhi_metrics, dy_metrics = load_metric_files(
+        args.pbr, args.roe, args.hhi, args.yield_file
+    )
 
     logic = derive_logic_summary(pbr_metrics, roe_metrics, dy_metrics, hhi_metrics)
     context: dict[str, Any] = {
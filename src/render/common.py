@@ -2,52 +2,77 @@
 
 from __future__ import annotations
 
-import json
 import logging
-import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
 from jinja2.runtime import Undefined
 
+from utils.io import load_json
+
 LOGGER = logging.getLogger(__name__)
 
 
 def is_missing(value: Any) -> bool:
-    if isinstance(value, Undefined):
-        return True
-    if isinstance(value, MissingValue):
-        return True
-    if value is None:
-        return True
-    if isinstance(value, float) and math.isnan(value):
+    if value is None or value is MISSING:
         return True
-    return False
+    if isinstance(value, float):
+        # NaN is the only float that is not equal to itself.
+        return value != value
+    return isinstance(value, Undefined | MissingValue)
 
 
-def format_number(value: Any, digits: int = 2) -> str:
-    if is_missing(value):
-        return "N/A"
+@lru_cache(maxsize=1024)
+def _format_fixed(number: float, digits: int) -> str:
+    # 0.0 and -0.0 share a cache key; adding 0.0 normalizes the sign so the
+    # cached string does not depend on which one was formatted first.
+    return f"{number + 0.0:.{digits}f}"
+
+
+def _coerce_number(value: Any) -> float | str:
+    """Return *value* as a float, or its string form when it is not numeric."""
+    if isinstance(value, int | float):
+        return float(value)
     try:
-        number = float(value)
+        return float(value)
     except (TypeError, ValueError):
         return str(value)
-    return f"{number:.{digits}f}"
+
+
+def format_number(value: Any, digits: int = 2) -> str:
+    if is_missing(value):
+        return "N/A"
+    number = _coerce_number(value)
+    if isinstance(number, str):
+        return number
+    return _format_fixed(number, digits)
 
 
 def format_percent(value: Any, digits: int = 1) -> str:
     if is_missing(value):
         return "N/A"
-    try:
-        number = float(value)
-    except (TypeError, ValueError):
-        return str(value)
+    number = _coerce_number(value)
+    if isinstance(number, str):
+        return number
     if number <= 1:
         number *= 100
-    return f"{number:.{digits}f}%"
+    return _format_fixed(number, digits) + "%"
+
+
+TEMPLATE_FILTERS = {
+    "format_number": format_number,
+    "format_percent": format_percent,
+}
 
 
 def load_metrics(path: Path | None) -> dict[str, Any]:
@@ -56,8 +81,13 @@ def load_metrics(path: Path | None) -> dict[str, Any]:
     if not path.exists():
         LOGGER.warning("Metrics file not found: %s", path)
         return {}
-    with path.open(encoding="utf-8") as handle:
-        return json.load(handle)
+    return load_json(path)
+
+
+def load_metric_files(*paths: Path | None) -> list[dict[str, Any]]:
+    """Load several metric files concurrently, preserving the argument order."""
+    with ThreadPoolExecutor(max_workers=max(len(paths), 1)) as executor:
+        return list(executor.map(load_metrics, paths))
 
 
 def resolve_badges() -> dict[str, dict[str, str]]:
@@ -76,17 +106,44 @@ def resolve_badges() -> dict[str, dict[str, str]]:
     }
 
 
+@lru_cache(maxsize=1)
+def _bytecode_cache() -> FileSystemBytecodeCache:
+    """Share compiled templates across runs via an on-disk bytecode cache.
+
+    The cache lives in ``$JINJA_CACHE_DIR`` when set, otherwise in Jinja's
+    default per-user temporary directory.
+    """
+    directory = os.getenv("JINJA_CACHE_DIR")
+    if directory:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(directory or None)
+
+
 def build_environment(
     template_path: Path, enable_autoescape: bool = False
 ) -> Environment:
+    """Return the shared Jinja environment for *template_path*'s directory.
+
+    Environments are cached per template directory and autoescape setting, so
+    every caller in the process reuses one loader and its compiled templates.
+    Treat the result as read-only: register filters in ``TEMPLATE_FILTERS``
+    instead of on the returned environment.
+    """
+    return _environment(template_path.resolve().parent, enable_autoescape)
+
+
+@lru_cache(maxsize=8)
+def _environment(directory: Path, enable_autoescape: bool) -> Environment:
     autoescape = select_autoescape(
         enabled_extensions=("html", "xml"), default=enable_autoescape
     )
     env = Environment(
-        loader=FileSystemLoader(str(template_path.parent)), autoescape=autoescape
+        loader=FileSystemLoader(str(directory)),
+        autoescape=autoescape,
+        auto_reload=False,
+        bytecode_cache=_bytecode_cache(),
     )
-    env.filters["format_number"] = format_number
-    env.filters["format_percent"] = format_percent
+    env.filters.update(TEMPLATE_FILTERS)
     return env
 
 
@@ -215,18 +272,31 @@ class MissingValue:
         return ""
 
 
+MISSING = MissingValue()
+
+
 class MetricAccessor:
-    """Helper that enables safe dot access inside Jinja templates."""
+    """Helper that enables safe dot access inside Jinja templates.
+
+    Nested dictionaries are wrapped once at construction time, so repeated
+    attribute lookups while rendering do not allocate new accessors.
+    """
 
     def __init__(self, data: dict[str, Any] | None):
         self._data = data or {}
+        self._children = {
+            key: MetricAccessor(value)
+            for key, value in self._data.items()
+            if isinstance(value, dict)
+        }
 
     def __getattr__(self, item: str) -> Any:
+        child = self._children.get(item)
+        if child is not None:
+            return child
         value = self._data.get(item)
-        if isinstance(value, dict):
-            return MetricAccessor(value)
         if value is None:
-            return MissingValue()
+            return MISSING
         return value
 
     def __getitem__(self, item: str) -> Any:
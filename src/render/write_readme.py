@@ -4,6 +4,8 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import logging
 from pathlib import Path
 from typing import Any
@@ -13,17 +15,20 @@ import sys
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+import render.common  # noqa: E402
 from render.common import (  # noqa: E402
     build_environment,
     current_timestamp,
     derive_logic_summary,
-    load_metrics,
+    load_metric_files,
     resolve_badges,
     wrap_metrics,
 )
 
 LOGGER = logging.getLogger(__name__)
 
+DIGEST_CHUNK_SIZE = 64 * 1024
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
@@ -34,19 +39,80 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--hhi", dest="hhi", type=Path)
     parser.add_argument("--yield", dest="yield_file", type=Path)
     parser.add_argument("--notes", dest="notes", type=Path)
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Render even if the inputs match the previous run",
+    )
     return parser.parse_args()
 
 
+def _digest_path(output: Path) -> Path:
+    return output.with_name(output.name + ".sha256")
+
+
+def _input_digest(args: argparse.Namespace) -> str:
+    """Hash everything the README depends on except the render timestamp.
+
+    Covers the template, the metric and notes files, the render code itself
+    and the badge settings taken from the environment.
+    """
+    digest = hashlib.sha256()
+    sources = (
+        args.template,
+        args.pbr,
+        args.roe,
+        args.hhi,
+        args.yield_file,
+        args.notes,
+        Path(__file__),
+        Path(render.common.__file__),
+    )
+    for source in sources:
+        if source is None or not source.exists():
+            digest.update(b"\0missing\0")
+            continue
+        with source.open("rb") as handle:
+            while chunk := handle.read(DIGEST_CHUNK_SIZE):
+                digest.update(chunk)
+        digest.update(b"\0")
+    digest.update(json.dumps(resolve_badges(), sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _write_rendered(rendered: str, output: Path) -> None:
+    """Write *rendered* without surrounding whitespace, ending in one newline.
+
+    Jinja already drops the template's final newline, so the common case is
+    written as-is instead of building a stripped copy of the whole README.
+    """
+    if rendered[:1].isspace() or rendered[-1:].isspace():
+        rendered = rendered.strip()
+    with output.open("w", encoding="utf-8") as handle:
+        handle.write(rendered)
+        handle.write("\n")
+
+
 def main() -> None:
     logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     args = parse_args()
 
+    digest_path = _digest_path(args.output)
+    digest = _input_digest(args)
+    if (
+        not args.force
+        and args.output.exists()
+        and digest_path.exists()
+        and digest_path.read_text(encoding="utf-8").strip() == digest
+    ):
+        LOGGER.info("README inputs unchanged; keeping %s", args.output)
+        return
+
     env = build_environment(args.template, enable_autoescape=False)
     template = env.get_template(args.template.name)
-    pbr_metrics = load_metrics(args.pbr)
-    roe_metrics = load_metrics(args.roe)
-    hhi_metrics = load_metrics(args.hhi)
-    dy_metrics = load_metrics(args.yield_file)
+    pbr_metrics, roe_metrics, hhi_metrics, dy_metrics = load_metric_files(
+        args.pbr, args.roe, args.hhi, args.yield_file
+    )
     logic = derive_logic_summary(pbr_metrics, roe_metrics, dy_metrics, hhi_metrics)
     context: dict[str, Any] = {
         "updated_at": current_timestamp(),
@@ -64,7 +130,8 @@ def main() -> None:
 
     rendered = template.render(**context)
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(rendered.strip() + "\n", encoding="utf-8")
+    _write_rendered(rendered, args.output)
+    digest_path.write_text(digest + "\n", encoding="utf-8")
     LOGGER.info("README generated at %s", args.output)
 
 
@@ -3,73 +3,357 @@
 from __future__ import annotations
 
 import json
+import logging
+import os
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 import yaml  # type: ignore[import-untyped]
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper  # type: ignore[assignment, unused-ignore]
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment, unused-ignore]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pacsv = None
+
+LOGGER = logging.getLogger(__name__)
+
+# Anything that can go wrong writing or reading the best-effort Parquet cache.
+PARQUET_ERRORS: tuple[type[Exception], ...] = (
+    ImportError,
+    OSError,
+    ValueError,
+    TypeError,
+)
+if pa is not None:
+    PARQUET_ERRORS += (pa.ArrowException,)
+
+# Known column types of the canonical CSV: identifiers stay strings (so codes
+# keep leading zeros and match the Parquet cache) and metrics are float64 even
+# when a column is entirely empty.
+CSV_STRING_COLUMNS = ("index", "code", "name", "sector")
+CSV_FLOAT_COLUMNS = ("pbr", "roe", "dy", "market_cap", "weight")
+
+
+def parquet_cache_path(path: str | Path) -> Path:
+    """Return the Parquet sibling used to cache the dataset stored at *path*.
+
+    The full file name is kept (``canonical.csv.parquet``) so that datasets
+    that only differ by extension never share a cache file.
+    """
+    file_path = Path(path)
+    return file_path.with_name(file_path.name + ".parquet")
+
+
+def dump_parquet_cache(dataset: pd.DataFrame, path: str | Path) -> None:
+    """Write *dataset* to the Parquet sibling of *path* when an engine exists.
+
+    The cache is best effort: when no Parquet engine is installed or the frame
+    cannot be stored (e.g. an object column mixing ints and strings), any
+    previous cache is removed and :func:`load_dataframe` keeps parsing the
+    source.
+    """
+    cache_path = parquet_cache_path(path)
+    # Written under a temporary name and moved into place, so an interrupted
+    # write never leaves a truncated cache that looks fresh.
+    partial = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        dataset.to_parquet(partial, index=False)
+        os.replace(partial, cache_path)
+    except PARQUET_ERRORS as exc:
+        LOGGER.debug("Skipping Parquet cache for %s (%s)", path, exc)
+        partial.unlink(missing_ok=True)
+        cache_path.unlink(missing_ok=True)
+
+
+def _load_parquet_cache(file_path: Path) -> pd.DataFrame | None:
+    cache_path = parquet_cache_path(file_path)
+    if not cache_path.exists():
+        return None
+    if cache_path.stat().st_mtime_ns < file_path.stat().st_mtime_ns:
+        return None
+    try:
+        return pd.read_parquet(cache_path)
+    except PARQUET_ERRORS as exc:
+        LOGGER.debug("Ignoring unreadable Parquet cache %s (%s)", cache_path, exc)
+        return None
+
+
+def _dict_entries(entries: list[Any]) -> list[dict[str, Any]]:
+    return [entry for entry in entries if isinstance(entry, dict)]
+
+
+def _arrow_dtype(arrow_type: Any) -> pd.ArrowDtype | None:
+    """``types_mapper`` keeping Arrow dtypes, except for all-null columns.
+
+    Arrow's null type cannot hold any fill value, so such columns fall back to
+    plain object columns of missing values.
+    """
+    if arrow_type == pa.null():
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def _records_frame(rows: list[dict[str, Any]]) -> pd.DataFrame:
+    """Build a frame from record dicts, column-wise through Arrow if possible.
+
+    Arrow infers each column's type in one C pass and the result keeps
+    Arrow-backed dtypes. Keys missing from a record become nulls. Records
+    Arrow cannot type consistently (e.g. mixed ints and strings in one column)
+    go through :meth:`pandas.DataFrame.from_records` instead.
+    """
+    if not rows:
+        return pd.DataFrame()
+    if pa is not None:
+        columns = dict.fromkeys(key for row in rows for key in row)
+        try:
+            # from_pandas=True turns float NaN (YAML's .nan) into a proper null,
+            # just as pandas treats it as missing.
+            table = pa.table(
+                {
+                    key: pa.array([row.get(key) for row in rows], from_pandas=True)
+                    for key in columns
+                }
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, OverflowError) as exc:
+            LOGGER.debug("pyarrow could not type the records (%s); using pandas", exc)
+        else:
+            return table.to_pandas(types_mapper=_arrow_dtype)
+    return pd.DataFrame.from_records(rows)
+
+
+def _grouped_frames(content: dict[str, Any]) -> list[pd.DataFrame]:
+    """Build one frame per ``{group: [records]}`` entry, tagged with its group.
+
+    Records that already carry an ``index`` value keep it; the group key only
+    fills the gaps, so no per-record dictionary copies are needed.
+    """
+    frames: list[pd.DataFrame] = []
+    for group, entries in content.items():
+        if not isinstance(entries, list):
+            continue
+        rows = _dict_entries(entries)
+        if not rows:
+            continue
+        frame = _records_frame(rows)
+        if "index" in frame.columns:
+            frame["index"] = frame["index"].fillna(group)
+        else:
+            frame["index"] = group
+        frames.append(frame)
+    return frames
+
+
+def _read_csv(file_path: Path) -> pd.DataFrame:
+    """Read a CSV file, preferring pyarrow's multithreaded reader.
+
+    Columns stay Arrow-backed (:class:`pandas.ArrowDtype`), avoiding a copy
+    into NumPy/object arrays, and the known canonical columns are parsed with
+    fixed types instead of being inferred. Falls back to
+    :func:`pandas.read_csv` when pyarrow is missing or cannot parse the file.
+    """
+    if pacsv is not None:
+        column_types = {
+            **dict.fromkeys(CSV_STRING_COLUMNS, pa.string()),
+            **dict.fromkeys(CSV_FLOAT_COLUMNS, pa.float64()),
+        }
+        # Match pandas' NA handling: blank and "NA"-like cells are missing in
+        # string columns too, not empty strings.
+        options = pacsv.ConvertOptions(
+            column_types=column_types,
+            null_values=[*pacsv.ConvertOptions().null_values, "<NA>", "None"],
+            strings_can_be_null=True,
+        )
+        try:
+            table = pacsv.read_csv(file_path, convert_options=options)
+            return table.to_pandas(types_mapper=_arrow_dtype)
+        except pa.ArrowInvalid as exc:
+            LOGGER.debug("pyarrow failed on %s (%s); using pandas", file_path, exc)
+    return pd.read_csv(file_path, dtype=dict.fromkeys(CSV_STRING_COLUMNS, "string"))
+
 
 def load_dataframe(path: str | Path) -> pd.DataFrame:
-    """Load a CSV or YAML file into a :class:`~pandas.DataFrame`.
+    """Load a CSV, YAML or Parquet file into a :class:`~pandas.DataFrame`.
 
     The canonical dataset is stored either as CSV or as a YAML document with a
     top-level ``records`` key. When the YAML file stores entries grouped by
     index name (for example ``{"yomiuri333": [...]}``), the helper will inject
     the grouping key into each record as the ``index`` column.
+
+    If a Parquet sibling written by :func:`dump_parquet_cache` is at least as
+    recent as the source file, it is read instead of re-parsing the source.
+
+    Parsed frames are memoized per resolved path, modification time and size,
+    so repeated loads of an unchanged file skip parsing. Each call returns its
+    own copy, which callers are free to modify.
     """
     file_path = Path(path)
     if not file_path.exists():
         raise FileNotFoundError(f"Dataset not found: {file_path}")
 
+    stat = file_path.stat()
+    cached = _load_dataframe_cached(file_path.resolve(), stat.st_mtime_ns, stat.st_size)
+    return cached.copy()
+
+
+@lru_cache(maxsize=32)
+def _load_dataframe_cached(file_path: Path, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse *file_path*; *mtime_ns* and *size* only key the cache."""
     suffix = file_path.suffix.lower()
+    if suffix == ".parquet":
+        return pd.read_parquet(file_path)
+
+    cached = _load_parquet_cache(file_path)
+    if cached is not None:
+        return cached
+
     if suffix == ".csv":
-        return pd.read_csv(file_path)
+        return _read_csv(file_path)
 
     if suffix in {".yaml", ".yml"}:
-        content = yaml.safe_load(file_path.read_text(encoding="utf-8"))
+        content = load_yaml(file_path)
         if content is None:
             return pd.DataFrame()
 
-        records: list[dict[str, Any]]
         if isinstance(content, dict):
             if "records" in content and isinstance(content["records"], list):
-                raw_records = content["records"]
-            else:
-                raw_records = []
-                for group, entries in content.items():
-                    if isinstance(entries, list):
-                        for entry in entries:
-                            if isinstance(entry, dict):
-                                normalized = {**entry}
-                                normalized.setdefault("index", group)
-                                raw_records.append(normalized)
-                if not raw_records:
-                    # Fallback: treat dictionary as a single record.
-                    raw_records = [content]
-            records = [entry for entry in raw_records if isinstance(entry, dict)]
-        elif isinstance(content, list):
-            records = [entry for entry in content if isinstance(entry, dict)]
-        else:
-            raise ValueError(f"Unsupported YAML structure in {file_path}")
-
-        return pd.DataFrame(records)
+                return _records_frame(_dict_entries(content["records"]))
+            frames = _grouped_frames(content)
+            if frames:
+                return pd.concat(frames, ignore_index=True)
+            # Fallback: treat dictionary as a single record.
+            return _records_frame([content])
+        if isinstance(content, list):
+            return _records_frame(_dict_entries(content))
+        raise ValueError(f"Unsupported YAML structure in {file_path}")
 
     raise ValueError(f"Unsupported file extension: {file_path.suffix}")
 
 
+JSON_PEEK_SIZE = 64
+
+
+def load_yaml(path: str | Path) -> Any:
+    """Parse a YAML document, using the LibYAML C loader when it is available.
+
+    The binary file handle is handed to the parser, which reads it in chunks
+    and decodes UTF-8 itself, so the whole document is never materialized as
+    a Python string.
+
+    Documents that are really JSON (the first non-blank byte is ``{`` or
+    ``[``) are parsed with :mod:`orjson` when it is installed; anything it
+    rejects, such as YAML flow mappings, still goes through the YAML loader.
+    """
+    with Path(path).open("rb") as handle:
+        if orjson is not None:
+            head = handle.read(JSON_PEEK_SIZE)
+            if head.lstrip()[:1] in (b"{", b"["):
+                data = head + handle.read()
+                try:
+                    return orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    return yaml.load(data, Loader=YamlLoader)
+            handle.seek(0)
+        return yaml.load(handle, Loader=YamlLoader)
+
+
+def load_json(path: str | Path) -> Any:
+    """Parse a JSON document, using :mod:`orjson` when it is installed.
+
+    Both parsers accept the raw UTF-8 bytes, so the file is read in one
+    unbuffered call and never decoded into an intermediate string.
+    """
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def dump_json(data: Any, path: str | Path) -> None:
     """Persist *data* as a JSON document."""
     file_path = Path(path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    file_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+    if orjson is not None:
+        options = (
+            orjson.OPT_INDENT_2
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+        )
+        file_path.write_bytes(orjson.dumps(data, option=options))
+        return
+    # ensure_ascii=False writes non-ASCII text as UTF-8 like orjson does; NaN
+    # and float spellings (e.g. 1e-07 vs 1e-7) still differ between the two.
+    text = json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False)
+    file_path.write_bytes(text.encode("utf-8"))
+
+
+YAML_DUMP_OPTIONS: dict[str, Any] = {
+    "Dumper": YamlDumper,
+    "sort_keys": False,
+    "allow_unicode": True,
+    "encoding": "utf-8",
+}
 
 
 def dump_yaml(data: Any, path: str | Path) -> None:
-    """Persist *data* as a YAML document."""
+    """Persist *data* as a YAML document.
+
+    The dumper encodes and writes straight to the binary file handle, so the
+    document is never built up as one Python string first.
+    """
+    file_path = Path(path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with file_path.open("wb") as handle:
+        yaml.dump(data, handle, **YAML_DUMP_OPTIONS)
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def dump_yaml_records(
+    header: dict[str, Any],
+    key: str,
+    records: Iterable[dict[str, Any]],
+    path: str | Path,
+    chunk_size: int = 1000,
+) -> None:
+    """Persist *header* plus a *key* list of *records* as one YAML document.
+
+    Records are serialized in chunks straight to the file, so the full list
+    never has to be held in memory. The output matches ``dump_yaml`` applied
+    to ``{**header, key: list(records)}``.
+    """
     file_path = Path(path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    file_path.write_text(
-        yaml.safe_dump(data, sort_keys=False, allow_unicode=True),
-        encoding="utf-8",
-    )
+    with file_path.open("wb") as handle:
+        if header:
+            yaml.dump(header, handle, **YAML_DUMP_OPTIONS)
+        wrote_records = False
+        for chunk in _chunked(records, chunk_size):
+            if not wrote_records:
+                handle.write(f"{key}:\n".encode())
+                wrote_records = True
+            yaml.dump(chunk, handle, **YAML_DUMP_OPTIONS)
+        if not wrote_records:
+            yaml.dump({key: []}, handle, **YAML_DUMP_OPTIONS)
@@ -2,26 +2,41 @@ from __future__ import annotations
 
 # ruff: noqa: I001
 
-import json
 from pathlib import Path
+import os
 import sys
 
 ROOT = Path(__file__).resolve().parents[1] / "src"
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import orjson  # noqa: E402
+import pandas as pd  # noqa: E402
 import pytest  # noqa: E402
 
+import utils.io  # noqa: E402
+
+from analysis._engine import (  # noqa: E402
+    compute_concentration_metrics_polars,
+    compute_pbr_stats_polars,
+    compute_roe_stats_polars,
+    load_polars,
+)
 from analysis.pbr_stats import compute_pbr_stats  # noqa: E402
-from analysis.roe_stats import compute_roe_stats  # noqa: E402
-from analysis.sector_hhi import compute_concentration_metrics  # noqa: E402
+from analysis.roe_stats import QUANTILES, compute_roe_stats  # noqa: E402
+from analysis.sector_hhi import TOP_N, compute_concentration_metrics  # noqa: E402
 from analysis.yield_stats import compute_yield_stats  # noqa: E402
-from ingest.csv_to_canonical import build_canonical  # noqa: E402
+from ingest.csv_to_canonical import build_canonical, write_output  # noqa: E402
 from render.common import derive_logic_summary  # noqa: E402
+from utils.io import (  # noqa: E402
+    dump_parquet_cache,
+    load_dataframe,
+    parquet_cache_path,
+)
 
 
-@pytest.fixture()
-def sample_files(tmp_path: Path) -> tuple[Path, Path]:
+@pytest.fixture(scope="module")
+def sample_files(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path]:
     constituents = {
         "yomiuri333": [
             {"code": "1001", "name": "Alpha", "sector": "Materials", "weight": 0.5},
@@ -76,17 +91,21 @@ def sample_files(tmp_path: Path) -> tuple[Path, Path]:
         },
     ]
 
+    tmp_path = tmp_path_factory.mktemp("raw")
     constituents_path = tmp_path / "constituents.yaml"
     financials_path = tmp_path / "financials.yaml"
-    constituents_path.write_text(json.dumps(constituents), encoding="utf-8")
-    financials_path.write_text(json.dumps(financials), encoding="utf-8")
+    constituents_path.write_bytes(orjson.dumps(constituents))
+    financials_path.write_bytes(orjson.dumps(financials))
     return constituents_path, financials_path
 
 
-def test_build_canonical(sample_files: tuple[Path, Path]) -> None:
-    constituents_path, financials_path = sample_files
-    dataset = build_canonical(constituents_path, financials_path)
+@pytest.fixture(scope="module")
+def dataset(sample_files: tuple[Path, Path]) -> pd.DataFrame:
+    """Canonical dataset shared by the tests; copy it before mutating."""
+    return build_canonical(*sample_files)
+
 
+def test_build_canonical(dataset: pd.DataFrame) -> None:
     assert set(dataset.columns) >= {
         "index",
         "code",
@@ -108,10 +127,7 @@ def test_build_canonical(sample_files: tuple[Path, Path]) -> None:
     )
 
 
-def test_metrics_and_logic(sample_files: tuple[Path, Path]) -> None:
-    constituents_path, financials_path = sample_files
-    dataset = build_canonical(constituents_path, financials_path)
-
+def test_metrics_and_logic(dataset: pd.DataFrame) -> None:
     pbr_metrics = compute_pbr_stats(dataset)
     roe_metrics = compute_roe_stats(dataset)
     dy_metrics = compute_yield_stats(dataset)
@@ -125,3 +141,145 @@ def test_metrics_and_logic(sample_files: tuple[Path, Path]) -> None:
     logic = derive_logic_summary(pbr_metrics, roe_metrics, dy_metrics, hhi_metrics)
     assert any("PBR" in item for item in logic["strengths"])
     assert any("ROE" in item for item in logic["weaknesses"])
+
+
+def test_polars_engine_matches_pandas(dataset: pd.DataFrame, tmp_path: Path) -> None:
+    pytest.importorskip("polars")
+    canonical_path = tmp_path / "canonical.csv"
+    dataset.to_csv(canonical_path, index=False)
+    frame = load_polars(canonical_path)
+
+    pbr_metrics = compute_pbr_stats_polars(frame)
+    roe_metrics = compute_roe_stats_polars(frame, QUANTILES)
+    hhi_metrics = compute_concentration_metrics_polars(frame, TOP_N)
+
+    expected_pbr = compute_pbr_stats(dataset)
+    expected_roe = compute_roe_stats(dataset)
+    expected_hhi = compute_concentration_metrics(dataset)
+    for index_name in ("yomiuri333", "topix"):
+        assert pbr_metrics["lt1"][index_name] == pytest.approx(
+            expected_pbr["lt1"][index_name]
+        )
+        assert roe_metrics["quantiles"]["75"][index_name] == pytest.approx(
+            expected_roe["quantiles"]["75"][index_name]
+        )
+        assert hhi_metrics["hhi"][index_name] == pytest.approx(
+            expected_hhi["hhi"][index_name]
+        )
+
+
+def test_metrics_ignore_unused_categories(dataset: pd.DataFrame) -> None:
+    dataset = dataset.copy()
+    dataset["index"] = pd.Categorical(
+        dataset["index"], categories=["yomiuri333", "topix", "unused"]
+    )
+    dataset["sector"] = pd.Categorical(dataset["sector"]).add_categories("Spare")
+
+    pbr_metrics = compute_pbr_stats(dataset)
+    hhi_metrics = compute_concentration_metrics(dataset)
+
+    assert set(pbr_metrics["count"]) == {"yomiuri333", "topix"}
+    assert set(hhi_metrics["hhi"]) == {"yomiuri333", "topix"}
+    assert hhi_metrics["hhi"]["yomiuri333"] == pytest.approx(0.5)
+
+
+def _set_mtime_ns(path: Path, mtime_ns: int) -> None:
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_parquet_cache_reuse_and_staleness(
+    dataset: pd.DataFrame, tmp_path: Path
+) -> None:
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "canonical.csv"
+    yaml_path = tmp_path / "canonical.yaml"
+    write_output(dataset, csv_path)
+    write_output(dataset.head(2), yaml_path)
+
+    # Sources that only differ by extension keep separate caches.
+    assert parquet_cache_path(csv_path) != parquet_cache_path(yaml_path)
+    assert len(load_dataframe(csv_path)) == 5
+    assert len(load_dataframe(yaml_path)) == 2
+
+    # A cache at least as recent as the source is read instead of the source.
+    dump_parquet_cache(dataset.head(1), csv_path)
+    cache_mtime = parquet_cache_path(csv_path).stat().st_mtime_ns
+    _set_mtime_ns(csv_path, cache_mtime - 1_000_000_000)
+    assert len(load_dataframe(csv_path)) == 1
+
+    # Once the source is newer, the stale cache is ignored.
+    _set_mtime_ns(csv_path, cache_mtime + 1_000_000_000)
+    assert len(load_dataframe(csv_path)) == 5
+
+
+def test_parquet_cache_is_best_effort(dataset: pd.DataFrame, tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    output_path = tmp_path / "canonical.csv"
+    write_output(dataset, output_path)
+    assert parquet_cache_path(output_path).exists()
+
+    mixed = dataset.copy()
+    mixed["name"] = mixed["name"].astype(object)
+    mixed.loc[0, "name"] = 7203
+    write_output(mixed, output_path)
+
+    assert not parquet_cache_path(output_path).exists()
+    assert len(load_dataframe(output_path)) == 5
+
+    # A corrupt cache that looks fresh falls back to parsing the source.
+    parquet_cache_path(output_path).write_bytes(b"PAR1garbage")
+    _set_mtime_ns(output_path, output_path.stat().st_mtime_ns - 1_000_000_000)
+    assert len(load_dataframe(output_path)) == 5
+
+
+@pytest.mark.parametrize("reader", ["pyarrow", "pandas"])
+def test_blank_csv_cells_read_as_missing(
+    reader: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if reader == "pyarrow":
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(utils.io, "pacsv", None)
+    csv_path = tmp_path / "canonical.csv"
+    csv_path.write_text(
+        "index,code,sector,weight\n"
+        "topix,1001,Unknown,1\n"
+        "topix,2002,,1\n"
+        "topix,3003,A,1\n"
+        "topix,4004,A,1\n",
+        encoding="utf-8",
+    )
+    dataset = load_dataframe(csv_path)
+
+    assert dataset["sector"].isna().tolist() == [False, True, False, False]
+    hhi_metrics = compute_concentration_metrics(dataset)
+    assert hhi_metrics["hhi"]["topix"] == pytest.approx(0.5)
+
+
+def test_yaml_dataset_without_sectors(tmp_path: Path) -> None:
+    yaml_path = tmp_path / "canonical.yaml"
+    records = [
+        {"index": "topix", "code": "1001", "sector": None, "weight": 0.5},
+        {"index": "topix", "code": "2002", "sector": None, "weight": 0.5},
+    ]
+    yaml_path.write_bytes(orjson.dumps({"records": records}))
+    dataset = load_dataframe(yaml_path)
+
+    hhi_metrics = compute_concentration_metrics(dataset)
+    assert hhi_metrics["hhi"]["topix"] == pytest.approx(1.0)
+
+
+def test_yaml_nan_weight_counts_as_missing(tmp_path: Path) -> None:
+    yaml_path = tmp_path / "canonical.yaml"
+    yaml_path.write_text(
+        "records:\n"
+        "- {index: topix, code: '1001', sector: A, weight: 0.6}\n"
+        "- {index: topix, code: '2002', sector: B, weight: .nan}\n"
+        "- {index: topix, code: '3003', sector: B, weight: 0.4}\n",
+        encoding="utf-8",
+    )
+    dataset = load_dataframe(yaml_path)
+
+    assert dataset["weight"].isna().tolist() == [False, True, False]
+    hhi_metrics = compute_concentration_metrics(dataset)
+    assert hhi_metrics["hhi"]["topix"] == pytest.approx(0.52)